@@ -10,7 +10,7 @@ from alembic import context
 # Import application components
 from app.core.config import settings
 from app.core.database import Base
-from app.models import Employee, Attendance  # noqa: F401 - ensures models are registered
+from app.models import Employee, Attendance, ReportJob, ChangeLog  # noqa: F401 - ensures models are registered
 
 # Alembic Config object
 config = context.config
@@ -0,0 +1,26 @@
+"""
+Shared API dependencies.
+"""
+
+from typing import Optional
+
+from fastapi import Header, Request
+
+from app.utils.client import resolve_client_ip
+
+
+def get_actor(
+    request: Request,
+    x_actor: Optional[str] = Header(None, description="Who is making the change (recorded in the audit log)"),
+) -> str:
+    """
+    Identify who performed a mutation for the audit log.
+    There is no authentication, so this is the X-Actor header when the
+    client sends one and the client address otherwise.
+    """
+    if x_actor:
+        return x_actor[:255]
+    return resolve_client_ip(
+        request.headers.get("x-forwarded-for"),
+        request.client.host if request.client else None,
+    )
@@ -3,20 +3,29 @@ Attendance API routes.
 Endpoints for managing attendance records.
 """
 
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
+from app.api.deps import get_actor
 from app.core.database import get_db
 from app.schemas.attendance import (
     AttendanceCreate,
     AttendanceResponse,
     AttendanceListResponse,
+    AttendanceBatchQuery,
+    AttendanceBatchResponse,
 )
 from app.crud.attendance import (
     create_attendance,
     get_all_attendance,
     get_attendance_by_employee,
+    get_attendance_for_employees,
 )
+from app.crud.audit import get_deleted_ids
+from app.utils.delta import server_now
 
 router = APIRouter(prefix="/api/attendance", tags=["Attendance"])
 
@@ -31,9 +40,10 @@ router = APIRouter(prefix="/api/attendance", tags=["Attendance"])
 def mark_attendance(
     attendance_data: AttendanceCreate,
     db: Session = Depends(get_db),
+    actor: str = Depends(get_actor),
 ):
     """Mark attendance for an employee."""
-    attendance = create_attendance(db=db, attendance_data=attendance_data)
+    attendance = create_attendance(db=db, attendance_data=attendance_data, actor=actor)
     return attendance
 
 
@@ -41,15 +51,46 @@ def mark_attendance(
     "",
     response_model=AttendanceListResponse,
     summary="Get all attendance records",
-    description="Retrieve all attendance records across all employees.",
+    description="Retrieve all attendance records across all employees, or only those changed since a timestamp.",
 )
-def list_attendance(db: Session = Depends(get_db)):
-    """Get all attendance records."""
-    records = get_all_attendance(db=db)
+def list_attendance(
+    since: Optional[datetime] = Query(None, description="Only return records updated since this server_time"),
+    db: Session = Depends(get_db),
+):
+    """Get all attendance records, or the delta since the previous sync."""
+    server_time = server_now()
+    records = get_all_attendance(db=db, since=since)
     return AttendanceListResponse(
         success=True,
         data=records,
         count=len(records),
+        deleted_ids=get_deleted_ids(db=db, entity="attendance", since=since) if since is not None else [],
+        server_time=server_time,
+    )
+
+
+@router.post(
+    "/query",
+    response_model=AttendanceBatchResponse,
+    summary="Get attendance for multiple employees",
+    description="Retrieve attendance records for a list of employees within an optional date range, grouped per employee.",
+)
+def query_attendance(
+    query: AttendanceBatchQuery,
+    db: Session = Depends(get_db),
+):
+    """Get attendance records for several employees in one request."""
+    grouped, unknown = get_attendance_for_employees(
+        db=db,
+        employee_ids=query.employee_ids,
+        start_date=query.start_date,
+        end_date=query.end_date,
+    )
+    return AttendanceBatchResponse(
+        success=True,
+        data=grouped,
+        unknown_employee_ids=unknown,
+        count=sum(len(records) for records in grouped.values()),
     )
 
 
@@ -0,0 +1,49 @@
+"""
+Audit log API routes.
+Endpoints for reading the employee and attendance change log.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.schemas.audit import ChangeLogListResponse
+from app.crud.audit import get_change_log
+
+router = APIRouter(prefix="/api/audit", tags=["Audit"])
+
+
+@router.get(
+    "",
+    response_model=ChangeLogListResponse,
+    summary="Get change log",
+    description="Retrieve employee and attendance changes newest first, filtered by time range and paged by cursor.",
+)
+def list_changes(
+    start: Optional[datetime] = Query(None, description="Earliest change time (inclusive)"),
+    end: Optional[datetime] = Query(None, description="Latest change time (inclusive)"),
+    entity: Optional[str] = Query(None, description="employee or attendance"),
+    entity_key: Optional[str] = Query(None, description="Employee ID or attendance record ID"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum entries per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+):
+    """Get a page of audit entries."""
+    entries, next_cursor = get_change_log(
+        db=db,
+        start=start,
+        end=end,
+        entity=entity,
+        entity_key=entity_key,
+        limit=limit,
+        cursor=cursor,
+    )
+    return ChangeLogListResponse(
+        success=True,
+        data=entries,
+        count=len(entries),
+        next_cursor=next_cursor,
+    )
@@ -3,21 +3,32 @@ Employee API routes.
 Endpoints for managing employee records.
 """
 
-from fastapi import APIRouter, Depends, status
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
+from app.api.deps import get_actor
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.jobs import submit_job
 from app.schemas.employee import (
     EmployeeCreate,
     EmployeeListResponse,
     EmployeeSingleResponse,
     DeleteResponse,
 )
+from app.schemas.attendance import UnmarkedAttendanceListResponse
 from app.crud.employee import (
     create_employee,
     get_all_employees,
     delete_employee,
+    purge_deleted_employees,
 )
+from app.crud.attendance import get_unmarked_attendance
+from app.crud.audit import get_deleted_ids
+from app.utils.delta import server_now
 
 router = APIRouter(prefix="/api/employees", tags=["Employees"])
 
@@ -32,9 +43,10 @@ router = APIRouter(prefix="/api/employees", tags=["Employees"])
 def add_employee(
     employee_data: EmployeeCreate,
     db: Session = Depends(get_db),
+    actor: str = Depends(get_actor),
 ):
     """Create a new employee."""
-    employee = create_employee(db=db, employee_data=employee_data)
+    employee = create_employee(db=db, employee_data=employee_data, actor=actor)
     return EmployeeSingleResponse(success=True, data=employee)
 
 
@@ -42,15 +54,50 @@ def add_employee(
     "",
     response_model=EmployeeListResponse,
     summary="Get all employees",
-    description="Retrieve a list of all employee records.",
+    description="Retrieve a list of all employee records, or only those changed since a timestamp.",
 )
-def list_employees(db: Session = Depends(get_db)):
-    """Get all employees."""
-    employees = get_all_employees(db=db)
+def list_employees(
+    since: Optional[datetime] = Query(None, description="Only return employees updated since this server_time"),
+    db: Session = Depends(get_db),
+):
+    """Get all employees, or the delta since the previous sync."""
+    server_time = server_now()
+    employees = get_all_employees(db=db, since=since)
     return EmployeeListResponse(
         success=True,
         data=employees,
         count=len(employees),
+        deleted_ids=get_deleted_ids(db=db, entity="employee", since=since) if since is not None else [],
+        server_time=server_time,
+    )
+
+
+@router.get(
+    "/unmarked",
+    response_model=UnmarkedAttendanceListResponse,
+    summary="Get employees without attendance",
+    description="List employees with no attendance record for each date in a range, paged by cursor.",
+)
+def list_unmarked_employees(
+    start_date: date = Query(..., description="First date to check"),
+    end_date: Optional[date] = Query(None, description="Last date to check (defaults to start_date)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+):
+    """Get (date, employee) pairs that have no attendance marked."""
+    rows, next_cursor = get_unmarked_attendance(
+        db=db,
+        start_date=start_date,
+        end_date=end_date or start_date,
+        limit=limit,
+        cursor=cursor,
+    )
+    return UnmarkedAttendanceListResponse(
+        success=True,
+        data=rows,
+        count=len(rows),
+        next_cursor=next_cursor,
     )
 
 
@@ -58,15 +105,39 @@ def list_employees(db: Session = Depends(get_db)):
     "/{employee_id}",
     response_model=DeleteResponse,
     summary="Delete an employee",
-    description="Delete an employee by their database ID. Also removes associated attendance records.",
+    description="Offboard an employee by their database ID. Attendance history is kept until the employee is purged.",
 )
 def remove_employee(
     employee_id: int,
     db: Session = Depends(get_db),
+    actor: str = Depends(get_actor),
 ):
     """Delete an employee by ID."""
-    employee = delete_employee(db=db, employee_db_id=employee_id)
+    employee = delete_employee(db=db, employee_db_id=employee_id, actor=actor)
     return DeleteResponse(
         success=True,
         message=f"Employee '{employee.full_name}' (ID: {employee.employee_id}) deleted successfully.",
     )
+
+
+@router.post(
+    "/purge",
+    response_model=DeleteResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Purge offboarded employees",
+    description="Queue permanent removal of employees deleted more than older_than_days ago, together with their attendance.",
+)
+def purge_employees(
+    older_than_days: int = Query(
+        settings.EMPLOYEE_PURGE_AFTER_DAYS,
+        ge=0,
+        description="Only purge employees deleted at least this many days ago",
+    ),
+):
+    """Queue a batched purge of soft-deleted employees."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    submit_job(purge_deleted_employees, cutoff, settings.PURGE_BATCH_SIZE)
+    return DeleteResponse(
+        success=True,
+        message=f"Purge queued for employees deleted before {cutoff.date().isoformat()}.",
+    )
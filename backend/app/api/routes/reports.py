@@ -0,0 +1,84 @@
+"""
+Report API routes.
+Endpoints for generating and downloading monthly attendance reports.
+"""
+
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.schemas.report import ReportJobCreate, ReportJobSingleResponse
+from app.crud.report import create_report_job, get_report_job
+
+router = APIRouter(prefix="/api/reports", tags=["Reports"])
+
+
+@router.post(
+    "",
+    response_model=ReportJobSingleResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Request a monthly report",
+    description="Queue a monthly per-employee or per-department attendance report. Closed months reuse the stored report.",
+)
+def request_report(
+    job_data: ReportJobCreate,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """Queue a monthly report job."""
+    job, cached = create_report_job(db=db, job_data=job_data)
+    if cached and job.status == "completed":
+        response.status_code = status.HTTP_200_OK
+    return ReportJobSingleResponse(success=True, data=job, cached=cached)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ReportJobSingleResponse,
+    summary="Get report status",
+    description="Retrieve the status of a report job.",
+)
+def get_report_status(
+    job_id: int,
+    db: Session = Depends(get_db),
+):
+    """Get a report job's status."""
+    job = get_report_job(db=db, job_id=job_id)
+    return ReportJobSingleResponse(success=True, data=job)
+
+
+@router.get(
+    "/{job_id}/download",
+    summary="Download a report",
+    description="Download a completed report as gzip-compressed CSV.",
+)
+def download_report(
+    job_id: int,
+    db: Session = Depends(get_db),
+):
+    """Download the file produced by a completed report job."""
+    job = get_report_job(db=db, job_id=job_id)
+    if job.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "success": False,
+                "message": f"Report job {job_id} is {job.status}, not completed.",
+            },
+        )
+    if not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail={
+                "success": False,
+                "message": f"Report file for job {job_id} is no longer available.",
+            },
+        )
+    return FileResponse(
+        job.file_path,
+        media_type="application/gzip",
+        filename=os.path.basename(job.file_path),
+    )
@@ -0,0 +1,217 @@
+"""
+Admission control module.
+Token-bucket rate limiting, a concurrency cap on expensive endpoints, and
+load shedding when requests are queueing for database connections.
+"""
+
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from urllib.parse import parse_qs
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from sqlalchemy.pool import Pool
+
+from app.core.config import settings
+from app.utils.client import resolve_client_ip
+
+logger = logging.getLogger(__name__)
+
+# Health checks must stay cheap and always answer
+EXEMPT_PATHS = {"/", "/api/health"}
+
+# Endpoints that scan whole tables; rate limited per route and concurrency capped
+EXPENSIVE_ROUTES = {
+    ("GET", "/api/employees"),
+    ("GET", "/api/employees/unmarked"),
+    ("GET", "/api/attendance"),
+    ("POST", "/api/attendance/query"),
+}
+
+# List routes whose ?since= delta requests are cheap index range reads
+DELTA_ROUTES = {
+    ("GET", "/api/employees"),
+    ("GET", "/api/attendance"),
+}
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets.
+    The default keeps buckets in process memory; subclass and pass an
+    instance to AdmissionControlMiddleware to share limits across workers.
+    """
+
+    @abstractmethod
+    def consume(self, key: str, rate: float, capacity: int) -> float:
+        """
+        Take one token from the bucket identified by key.
+        Returns 0.0 if the token was granted, otherwise the number of
+        seconds until one becomes available.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local token buckets."""
+
+    # Prune idle buckets once this many keys are tracked
+    MAX_KEYS = 10000
+
+    def __init__(self) -> None:
+        # key -> (tokens, last update, time the bucket is full again)
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rate: float, capacity: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            tokens, updated = (bucket[0], bucket[1]) if bucket else (float(capacity), now)
+            tokens = min(float(capacity), tokens + (now - updated) * rate)
+            granted = tokens >= 1.0
+            if granted:
+                tokens -= 1.0
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+            if len(self._buckets) > self.MAX_KEYS:
+                self._prune(now)
+        return 0.0 if granted else (1.0 - tokens) / rate
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled completely at their own rate."""
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if now < bucket[2]
+        }
+
+
+def _client_key(scope) -> str:
+    """Identify the caller; X-Forwarded-For only counts behind trusted proxies."""
+    forwarded_for = None
+    for name, value in scope.get("headers", []):
+        if name == b"x-forwarded-for":
+            forwarded_for = value.decode("latin-1")
+            break
+    client = scope.get("client")
+    return resolve_client_ip(forwarded_for, client[0] if client else None)
+
+
+def _is_expensive(method: str, path: str, query_string: bytes) -> bool:
+    """Full-table requests; ?since= deltas on list routes do not count."""
+    route = (method, path)
+    if route not in EXPENSIVE_ROUTES:
+        return False
+    if route in DELTA_ROUTES and "since" in parse_qs(query_string.decode("latin-1")):
+        return False
+    return True
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware that rejects requests early instead of letting them
+    pile up on the database connection pool.
+    Answers 429 when a rate limit is exceeded and 503 when expensive
+    endpoints or the pool are saturated, both with a Retry-After header.
+    """
+
+    def __init__(
+        self,
+        app,
+        pool: Pool,
+        pool_capacity: int,
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        self.app = app
+        self.pool = pool
+        # pool_size + max_overflow: connections available before requests queue
+        self.pool_capacity = pool_capacity
+        self.backend = backend or InMemoryRateLimitBackend()
+        self._inflight = 0
+        self._expensive_inflight = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"].rstrip("/") or "/"
+        expensive = _is_expensive(method, path, scope.get("query_string", b""))
+
+        retry_after = self.backend.consume(
+            f"client:{_client_key(scope)}",
+            settings.RATE_LIMIT_CLIENT_PER_SECOND,
+            settings.RATE_LIMIT_CLIENT_BURST,
+        )
+        if not retry_after and expensive:
+            retry_after = self.backend.consume(
+                f"route:{method} {path}",
+                settings.RATE_LIMIT_EXPENSIVE_PER_SECOND,
+                settings.RATE_LIMIT_EXPENSIVE_BURST,
+            )
+        if retry_after:
+            await self._reject(
+                scope, receive, send,
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "Too many requests. Please slow down.",
+                retry_after,
+            )
+            return
+
+        if expensive and self._expensive_inflight >= settings.EXPENSIVE_MAX_CONCURRENCY:
+            await self._reject(
+                scope, receive, send,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "Server is busy. Please retry shortly.",
+                1,
+            )
+            return
+
+        if self._db_queue_depth() >= settings.DB_QUEUE_MAX_DEPTH:
+            logger.warning(f"Shedding {method} {path}: database pool queue is full")
+            await self._reject(
+                scope, receive, send,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "Server is busy. Please retry shortly.",
+                1,
+            )
+            return
+
+        self._inflight += 1
+        if expensive:
+            self._expensive_inflight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._inflight -= 1
+            if expensive:
+                self._expensive_inflight -= 1
+
+    def _db_queue_depth(self) -> int:
+        """
+        Estimate how many admitted requests are waiting for a connection.
+        Zero while the pool still has connections to hand out.
+        """
+        if self.pool.checkedout() < self.pool_capacity:
+            return 0
+        return self._inflight - self.pool_capacity
+
+    @staticmethod
+    async def _reject(scope, receive, send, status_code: int, message: str, retry_after: float) -> None:
+        response = JSONResponse(
+            status_code=status_code,
+            content={
+                "success": False,
+                "message": message,
+            },
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
@@ -17,6 +17,41 @@ class Settings(BaseSettings):
     # Database (loaded from .env, falls back to empty string → SQLite in database.py)
     DATABASE_URL: str = ""
 
+    # SQLite tuning (only applied when running on the SQLite fallback)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_CACHE_SIZE_KB: int = 65536  # 64 MiB page cache per connection
+
+    # Delta sync: rows updated this many seconds before ?since= are resent,
+    # covering transactions that committed after a client's previous sync
+    SYNC_OVERLAP_SECONDS: int = 5
+
+    # Admission control (token buckets are per process unless a shared
+    # backend is plugged into AdmissionControlMiddleware)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_CLIENT_PER_SECOND: float = 10.0
+    RATE_LIMIT_CLIENT_BURST: int = 40
+    RATE_LIMIT_EXPENSIVE_PER_SECOND: float = 5.0
+    RATE_LIMIT_EXPENSIVE_BURST: int = 10
+    EXPENSIVE_MAX_CONCURRENCY: int = 4
+    DB_QUEUE_MAX_DEPTH: int = 10
+    # Number of reverse proxies that append to X-Forwarded-For (1 on Render).
+    # 0 ignores the header, since any client can set it.
+    TRUSTED_PROXY_HOPS: int = 0
+
+    # Background reports
+    REPORTS_DIR: str = "./reports"
+
+    # Background job pool, shared by report generation and employee purges
+    JOB_WORKERS: int = 2
+    # Jobs whose owner has not refreshed them for 3 heartbeats are treated
+    # as interrupted
+    JOB_HEARTBEAT_SECONDS: int = 30
+
+    # Offboarded employees (soft-deleted) are purged after this many days
+    EMPLOYEE_PURGE_AFTER_DAYS: int = 365
+    PURGE_BATCH_SIZE: int = 500
+
     # CORS — stored as comma-separated string, parsed into list via property
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000,http://127.0.0.1:5173,http://127.0.0.1:3000"
 
@@ -4,7 +4,10 @@ Sets up SQLAlchemy engine, session, and declarative base.
 Supports both PostgreSQL (production) and SQLite (local fallback).
 """
 
-from sqlalchemy import create_engine
+import threading
+from contextlib import contextmanager, nullcontext
+
+from sqlalchemy import Date, cast, create_engine, event, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -27,27 +30,89 @@ is_sqlite = db_url.startswith("sqlite")
 # Connection arguments
 connect_args: dict = {}
 if is_sqlite:
-    connect_args = {"check_same_thread": False}
+    connect_args = {
+        "check_same_thread": False,
+        "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+    }
 else:
     # Render PostgreSQL requires SSL
     connect_args = {"sslmode": "require"}
 
+# Connection pool sizing (shared with admission control)
+POOL_SIZE = 5
+POOL_MAX_OVERFLOW = 10
+
 # Create database engine with appropriate pool settings
 if is_sqlite:
     engine = create_engine(
         db_url,
         connect_args=connect_args,
         pool_pre_ping=True,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
     )
 else:
     engine = create_engine(
         db_url,
         connect_args=connect_args,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
     )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection for concurrent use.
+    WAL lets readers proceed while a writer commits, and foreign_keys=ON
+    makes the attendance ON DELETE CASCADE constraint actually apply.
+    """
+    if not is_sqlite:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        # Negative cache_size is expressed in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+    finally:
+        cursor.close()
+
+
+# SQLite allows a single writer at a time; queue writers in-process instead
+# of letting them race for the file lock and fail with "database is locked".
+_sqlite_write_lock = threading.Lock()
+
+
+@contextmanager
+def _sqlite_writer():
+    with _sqlite_write_lock:
+        yield
+
+
+def serialized_write():
+    """
+    Context manager that serialises write transactions on SQLite.
+    Enter it before the first query of a write so the whole transaction
+    runs under the lock. A no-op on PostgreSQL.
+    """
+    return _sqlite_writer() if is_sqlite else nullcontext()
+
+
+def date_of(column):
+    """
+    SQL expression for the calendar date of a timestamp column.
+    SQLite keeps timestamps as text, where CAST(... AS DATE) yields the year.
+    """
+    if is_sqlite:
+        return func.date(column, type_=Date)
+    return cast(column, Date)
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
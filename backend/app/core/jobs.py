@@ -0,0 +1,73 @@
+"""
+Background job module.
+A small in-process worker pool for work that should not run inside a request,
+plus a heartbeat so other processes can tell this one's jobs are still alive.
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process as the owner of the jobs it queues; unique per
+# start so a restarted process never mistakes old jobs for its own
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+_executor: ThreadPoolExecutor | None = None
+_heartbeat_stop: threading.Event | None = None
+
+
+def _log_failure(future: Future) -> None:
+    """Surface exceptions that escaped a job instead of dropping them."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Background job failed: {exc}", exc_info=exc)
+
+
+def submit_job(fn: Callable, *args) -> Future:
+    """Queue fn(*args) on the background worker pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.JOB_WORKERS,
+            thread_name_prefix="hrms-job",
+        )
+    future = _executor.submit(fn, *args)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def start_heartbeat(fn: Callable[[], None]) -> None:
+    """Call fn every JOB_HEARTBEAT_SECONDS on a daemon thread until shutdown."""
+    global _heartbeat_stop
+    if _heartbeat_stop is not None:
+        return
+    stop = threading.Event()
+
+    def beat() -> None:
+        while not stop.wait(settings.JOB_HEARTBEAT_SECONDS):
+            try:
+                fn()
+            except Exception as e:
+                logger.error(f"Job heartbeat failed: {e}", exc_info=True)
+
+    threading.Thread(target=beat, name="hrms-job-heartbeat", daemon=True).start()
+    _heartbeat_stop = stop
+
+
+def shutdown_jobs() -> None:
+    """Stop accepting jobs and wait for running ones to finish."""
+    global _executor, _heartbeat_stop
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+    if _heartbeat_stop is not None:
+        _heartbeat_stop.set()
+        _heartbeat_stop = None
@@ -4,84 +4,107 @@ Handles all database operations for the Attendance model.
 """
 
 import logging
-from datetime import date
+from datetime import date, datetime
+from sqlalchemy import Date, and_, cast, exists, func, literal, literal_column, or_, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
+from app.core.database import date_of, is_sqlite, serialized_write
+from app.crud.audit import record_change, row_image
 from app.models.attendance import Attendance
 from app.models.employee import Employee
 from app.schemas.attendance import AttendanceCreate
+from app.utils.delta import delta_cutoff
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the span of a gap-detection query, in days
+MAX_UNMARKED_RANGE_DAYS = 366
 
-def create_attendance(db: Session, attendance_data: AttendanceCreate) -> Attendance:
+
+def create_attendance(
+    db: Session,
+    attendance_data: AttendanceCreate,
+    actor: str | None = None,
+) -> Attendance:
     """
     Mark attendance for an employee.
     Validates employee exists and prevents duplicate entries.
     """
-    # Verify the employee exists
-    employee = (
-        db.query(Employee)
-        .filter(Employee.employee_id == attendance_data.employee_id)
-        .first()
-    )
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "success": False,
-                "message": f"Employee with ID '{attendance_data.employee_id}' does not exist.",
-            },
+    with serialized_write():
+        # Verify the employee exists and has not been offboarded
+        employee = (
+            db.query(Employee)
+            .filter(Employee.employee_id == attendance_data.employee_id, Employee.is_active)
+            .first()
         )
+        if not employee:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "success": False,
+                    "message": f"Employee with ID '{attendance_data.employee_id}' does not exist.",
+                },
+            )
 
-    # Check for duplicate attendance on the same date
-    existing = (
-        db.query(Attendance)
-        .filter(
-            Attendance.employee_id == attendance_data.employee_id,
-            Attendance.date == attendance_data.date,
-        )
-        .first()
-    )
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "success": False,
-                "message": f"Attendance for employee '{attendance_data.employee_id}' on {attendance_data.date} already exists.",
-            },
+        # Check for duplicate attendance on the same date
+        existing = (
+            db.query(Attendance)
+            .filter(
+                Attendance.employee_id == attendance_data.employee_id,
+                Attendance.date == attendance_data.date,
+            )
+            .first()
         )
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "success": False,
+                    "message": f"Attendance for employee '{attendance_data.employee_id}' on {attendance_data.date} already exists.",
+                },
+            )
 
-    try:
-        db_attendance = Attendance(
-            employee_id=attendance_data.employee_id,
-            date=attendance_data.date,
-            status=attendance_data.status,
-        )
-        db.add(db_attendance)
-        db.commit()
-        db.refresh(db_attendance)
-        logger.info(
-            f"Marked attendance: {db_attendance.employee_id} - {db_attendance.date} - {db_attendance.status}"
-        )
-        return db_attendance
-    except IntegrityError as e:
-        db.rollback()
-        logger.error(f"IntegrityError creating attendance: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "success": False,
-                "message": "Duplicate attendance entry.",
-            },
-        )
+        try:
+            db_attendance = Attendance(
+                employee_id=attendance_data.employee_id,
+                date=attendance_data.date,
+                status=attendance_data.status,
+            )
+            db.add(db_attendance)
+            db.flush()
+            record_change(
+                db, "attendance", str(db_attendance.id), "create",
+                after=row_image(db_attendance), actor=actor,
+            )
+            db.commit()
+            db.refresh(db_attendance)
+            logger.info(
+                f"Marked attendance: {db_attendance.employee_id} - {db_attendance.date} - {db_attendance.status}"
+            )
+            return db_attendance
+        except IntegrityError as e:
+            db.rollback()
+            logger.error(f"IntegrityError creating attendance: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "success": False,
+                    "message": "Duplicate attendance entry.",
+                },
+            )
 
 
-def get_all_attendance(db: Session) -> list[Attendance]:
-    """Retrieve all attendance records ordered by date (newest first)."""
-    return db.query(Attendance).order_by(Attendance.date.desc()).all()
+def get_all_attendance(db: Session, since: datetime | None = None) -> list[Attendance]:
+    """
+    Retrieve attendance records ordered by date (newest first).
+    When since is given, only rows updated after it are returned.
+    """
+    query = db.query(Attendance)
+    if since is not None:
+        query = query.filter(Attendance.updated_at >= delta_cutoff(since))
+    return query.order_by(Attendance.date.desc()).all()
 
 
 def get_attendance_by_employee(db: Session, employee_id: str) -> list[Attendance]:
@@ -110,3 +133,146 @@ def get_attendance_by_employee(db: Session, employee_id: str) -> list[Attendance
         .order_by(Attendance.date.desc())
         .all()
     )
+
+
+def get_attendance_for_employees(
+    db: Session,
+    employee_ids: list[str],
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> tuple[dict[str, list[Attendance]], list[str]]:
+    """
+    Retrieve attendance records for several employees in a single query.
+    Returns records grouped per employee plus the IDs that do not exist.
+    """
+    # Outer join from employees so known employees with no records still
+    # appear, while the date filters stay in the ON clause.
+    join_condition = Attendance.employee_id == Employee.employee_id
+    if start_date is not None:
+        join_condition &= Attendance.date >= start_date
+    if end_date is not None:
+        join_condition &= Attendance.date <= end_date
+
+    requested = list(dict.fromkeys(employee_ids))
+    rows = (
+        db.query(Employee.employee_id, Attendance)
+        .outerjoin(Attendance, join_condition)
+        .filter(Employee.employee_id.in_(requested))
+        .order_by(Employee.employee_id, Attendance.date.desc())
+        .all()
+    )
+
+    grouped: dict[str, list[Attendance]] = {}
+    for employee_id, record in rows:
+        records = grouped.setdefault(employee_id, [])
+        if record is not None:
+            records.append(record)
+
+    unknown = [employee_id for employee_id in requested if employee_id not in grouped]
+    return grouped, unknown
+
+
+def _date_series(start_date: date, end_date: date):
+    """
+    Build a CTE with one row per calendar day in [start_date, end_date].
+    Uses generate_series on PostgreSQL and a recursive CTE on SQLite.
+    """
+    if not is_sqlite:
+        day = func.generate_series(
+            literal(start_date, Date),
+            literal(end_date, Date),
+            literal_column("interval '1 day'"),
+        )
+        return select(cast(day, Date).label("day")).cte("dates")
+
+    dates = select(literal(start_date, Date).label("day")).cte("dates", recursive=True)
+    return dates.union_all(
+        select(func.date(dates.c.day, "+1 day", type_=Date)).where(
+            dates.c.day < literal(end_date, Date)
+        )
+    )
+
+
+def _parse_unmarked_cursor(cursor: str) -> tuple[date, str]:
+    """Split a '<date>|<employee_id>' keyset cursor into its parts."""
+    try:
+        cursor_date, cursor_employee_id = cursor.split("|", 1)
+        return date.fromisoformat(cursor_date), cursor_employee_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "message": "Invalid cursor.",
+            },
+        )
+
+
+def get_unmarked_attendance(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> tuple[list, str | None]:
+    """
+    List (date, employee) pairs with no attendance record in a date range.
+    The gap is computed in SQL as an anti-join against a generated date
+    series and paged with a keyset cursor ordered by (date, employee_id).
+    Returns the page rows and the cursor for the next page, if any.
+    """
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "message": "start_date must be on or before end_date.",
+            },
+        )
+    if (end_date - start_date).days >= MAX_UNMARKED_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "message": f"Date range cannot exceed {MAX_UNMARKED_RANGE_DAYS} days.",
+            },
+        )
+
+    after_date, after_employee_id = None, None
+    if cursor:
+        after_date, after_employee_id = _parse_unmarked_cursor(cursor)
+        # Days before the cursor can never appear on later pages
+        start_date = max(start_date, after_date)
+
+    dates = _date_series(start_date, end_date)
+    marked = exists().where(
+        Attendance.employee_id == Employee.employee_id,
+        Attendance.date == dates.c.day,
+    )
+    query = (
+        select(
+            dates.c.day.label("date"),
+            Employee.employee_id,
+            Employee.full_name,
+            Employee.department,
+        )
+        # Days before an employee was added cannot be missing attendance
+        .select_from(dates.join(Employee, date_of(Employee.created_at) <= dates.c.day))
+        .where(Employee.is_active, ~marked)
+    )
+    if after_date is not None:
+        query = query.where(
+            or_(
+                dates.c.day > after_date,
+                and_(dates.c.day == after_date, Employee.employee_id > after_employee_id),
+            )
+        )
+    query = query.order_by(dates.c.day, Employee.employee_id).limit(limit + 1)
+
+    rows = db.execute(query).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = f"{last.date.isoformat()}|{last.employee_id}"
+    return rows, next_cursor
@@ -0,0 +1,160 @@
+"""
+Audit log CRUD operations.
+Buffers change-log entries on the session and writes them in the same
+transaction as the mutation they describe, as a single batched insert.
+"""
+
+from datetime import date, datetime, timezone
+from sqlalchemy import and_, event, insert, inspect, or_
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from app.core.database import SessionLocal
+from app.models.change_log import ChangeLog
+from app.utils.delta import delta_cutoff
+
+_BUFFER_KEY = "audit_buffer"
+
+
+def row_image(obj) -> dict:
+    """
+    Snapshot an ORM row's loaded column values as JSON-safe data.
+    Unloaded attributes (e.g. server defaults right after a flush) are
+    skipped rather than fetched, keeping auditing off the query path.
+    """
+    state = inspect(obj)
+    image = {}
+    for attr in state.mapper.column_attrs:
+        if attr.key in state.unloaded:
+            continue
+        value = getattr(obj, attr.key)
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        image[attr.key] = value
+    return image
+
+
+def record_change(
+    db: Session,
+    entity: str,
+    entity_key: str,
+    action: str,
+    before: dict | None = None,
+    after: dict | None = None,
+    actor: str | None = None,
+) -> None:
+    """
+    Buffer an audit entry on the session.
+    Entries are inserted when the session commits and discarded if it
+    rolls back, so the log never disagrees with the data.
+    """
+    db.info.setdefault(_BUFFER_KEY, []).append(
+        {
+            "entity": entity,
+            "entity_key": entity_key,
+            "action": action,
+            "actor": actor,
+            "before": before,
+            "after": after,
+            "created_at": datetime.now(timezone.utc),
+        }
+    )
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _flush_audit_buffer(session: Session) -> None:
+    """Write buffered entries with one executemany insert inside the transaction."""
+    entries = session.info.pop(_BUFFER_KEY, None)
+    if entries:
+        session.execute(insert(ChangeLog), entries)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_audit_buffer(session: Session) -> None:
+    session.info.pop(_BUFFER_KEY, None)
+
+
+def get_deleted_ids(db: Session, entity: str, since: datetime) -> list[int]:
+    """
+    Database ids of rows of an entity deleted or purged since a delta sync.
+    Served from the change log, which keeps a tombstone (the before image)
+    for every removal, so delta clients never rely on row counts.
+    """
+    entries = (
+        db.query(ChangeLog.before)
+        .filter(
+            ChangeLog.entity == entity,
+            ChangeLog.action.in_(["delete", "purge"]),
+            ChangeLog.created_at >= delta_cutoff(since),
+        )
+        .all()
+    )
+    return sorted({before["id"] for (before,) in entries if before and "id" in before})
+
+
+def _parse_audit_cursor(cursor: str) -> tuple[datetime, int]:
+    """Split a '<created_at>|<id>' keyset cursor into its parts."""
+    try:
+        cursor_time, cursor_id = cursor.rsplit("|", 1)
+        return datetime.fromisoformat(cursor_time), int(cursor_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "message": "Invalid cursor.",
+            },
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps as UTC, matching how entries are stored."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def get_change_log(
+    db: Session,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    entity: str | None = None,
+    entity_key: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> tuple[list[ChangeLog], str | None]:
+    """
+    Retrieve audit entries newest first within an optional time range.
+    Paged with a keyset cursor over the (created_at, id) index.
+    Returns the page and the cursor for the next page, if any.
+    """
+    query = db.query(ChangeLog)
+    if start is not None:
+        query = query.filter(ChangeLog.created_at >= _as_utc(start))
+    if end is not None:
+        query = query.filter(ChangeLog.created_at <= _as_utc(end))
+    if entity is not None:
+        query = query.filter(ChangeLog.entity == entity)
+    if entity_key is not None:
+        query = query.filter(ChangeLog.entity_key == entity_key)
+    if cursor:
+        cursor_time, cursor_id = _parse_audit_cursor(cursor)
+        cursor_time = _as_utc(cursor_time)
+        query = query.filter(
+            or_(
+                ChangeLog.created_at < cursor_time,
+                and_(ChangeLog.created_at == cursor_time, ChangeLog.id < cursor_id),
+            )
+        )
+
+    entries = (
+        query.order_by(ChangeLog.created_at.desc(), ChangeLog.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    next_cursor = None
+    if len(entries) > limit:
+        entries = entries[:limit]
+        last = entries[-1]
+        next_cursor = f"{last.created_at.isoformat()}|{last.id}"
+    return entries, next_cursor
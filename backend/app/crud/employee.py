@@ -4,101 +4,200 @@ Handles all database operations for the Employee model.
 """
 
 import logging
+from datetime import datetime, timezone
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
+from app.core.database import SessionLocal, serialized_write
+from app.crud.audit import record_change, row_image
+from app.models.attendance import Attendance
 from app.models.employee import Employee
 from app.schemas.employee import EmployeeCreate
+from app.utils.delta import delta_cutoff
 
 logger = logging.getLogger(__name__)
 
 
-def create_employee(db: Session, employee_data: EmployeeCreate) -> Employee:
+def create_employee(db: Session, employee_data: EmployeeCreate, actor: str | None = None) -> Employee:
     """
     Create a new employee record.
     Raises HTTPException if employee_id or email already exists.
     """
-    # Check for duplicate employee_id
-    existing_by_id = (
-        db.query(Employee)
-        .filter(Employee.employee_id == employee_data.employee_id)
-        .first()
-    )
-    if existing_by_id:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "success": False,
-                "message": f"Employee with ID '{employee_data.employee_id}' already exists.",
-            },
+    with serialized_write():
+        # Check for duplicate employee_id
+        existing_by_id = (
+            db.query(Employee)
+            .filter(Employee.employee_id == employee_data.employee_id)
+            .first()
         )
+        if existing_by_id:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "success": False,
+                    "message": f"Employee with ID '{employee_data.employee_id}' already exists.",
+                },
+            )
 
-    # Check for duplicate email
-    existing_by_email = (
-        db.query(Employee)
-        .filter(Employee.email == employee_data.email)
-        .first()
-    )
-    if existing_by_email:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "success": False,
-                "message": f"Employee with email '{employee_data.email}' already exists.",
-            },
+        # Check for duplicate email
+        existing_by_email = (
+            db.query(Employee)
+            .filter(Employee.email == employee_data.email, Employee.is_active)
+            .first()
         )
+        if existing_by_email:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "success": False,
+                    "message": f"Employee with email '{employee_data.email}' already exists.",
+                },
+            )
 
-    try:
-        db_employee = Employee(
-            employee_id=employee_data.employee_id,
-            full_name=employee_data.full_name,
-            email=employee_data.email,
-            department=employee_data.department,
-        )
-        db.add(db_employee)
-        db.commit()
-        db.refresh(db_employee)
-        logger.info(f"Created employee: {db_employee.employee_id}")
-        return db_employee
-    except IntegrityError as e:
-        db.rollback()
-        logger.error(f"IntegrityError creating employee: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "success": False,
-                "message": "Duplicate employee record. Check employee_id and email.",
-            },
-        )
+        try:
+            db_employee = Employee(
+                employee_id=employee_data.employee_id,
+                full_name=employee_data.full_name,
+                email=employee_data.email,
+                department=employee_data.department,
+            )
+            db.add(db_employee)
+            db.flush()
+            record_change(
+                db, "employee", db_employee.employee_id, "create",
+                after=row_image(db_employee), actor=actor,
+            )
+            db.commit()
+            db.refresh(db_employee)
+            logger.info(f"Created employee: {db_employee.employee_id}")
+            return db_employee
+        except IntegrityError as e:
+            db.rollback()
+            logger.error(f"IntegrityError creating employee: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "success": False,
+                    "message": "Duplicate employee record. Check employee_id and email.",
+                },
+            )
 
 
-def get_all_employees(db: Session) -> list[Employee]:
-    """Retrieve all employee records ordered by creation date (newest first)."""
-    return db.query(Employee).order_by(Employee.created_at.desc()).all()
+def get_all_employees(db: Session, since: datetime | None = None) -> list[Employee]:
+    """
+    Retrieve active employee records ordered by creation date (newest first).
+    When since is given, only rows updated after it are returned; offboarded
+    employees reach delta clients as tombstones via get_deleted_ids.
+    """
+    query = db.query(Employee).filter(Employee.is_active)
+    if since is not None:
+        query = query.filter(Employee.updated_at >= delta_cutoff(since))
+    return query.order_by(Employee.created_at.desc()).all()
 
 
 def get_employee_by_id(db: Session, employee_id: str) -> Employee | None:
-    """Retrieve a single employee by employee_id."""
-    return db.query(Employee).filter(Employee.employee_id == employee_id).first()
+    """Retrieve a single active employee by employee_id."""
+    return (
+        db.query(Employee)
+        .filter(Employee.employee_id == employee_id, Employee.is_active)
+        .first()
+    )
 
 
-def delete_employee(db: Session, employee_db_id: int) -> Employee:
+def delete_employee(db: Session, employee_db_id: int, actor: str | None = None) -> Employee:
     """
-    Delete an employee by database primary key ID.
+    Offboard an employee by database primary key ID.
+    This is a soft delete: the row is flagged with deleted_at and its
+    attendance history is kept until purge_deleted_employees removes it.
     Raises HTTPException if employee not found.
     """
-    employee = db.query(Employee).filter(Employee.id == employee_db_id).first()
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "success": False,
-                "message": f"Employee with ID {employee_db_id} not found.",
-            },
+    with serialized_write():
+        employee = (
+            db.query(Employee)
+            .filter(Employee.id == employee_db_id, Employee.is_active)
+            .first()
+        )
+        if not employee:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "success": False,
+                    "message": f"Employee with ID {employee_db_id} not found.",
+                },
+            )
+
+        before = row_image(employee)
+        employee.deleted_at = datetime.now(timezone.utc)
+        record_change(
+            db, "employee", employee.employee_id, "delete",
+            before=before, after=row_image(employee), actor=actor,
+        )
+        db.commit()
+        logger.info(f"Deleted employee: {employee.employee_id}")
+        return employee
+
+
+def purge_deleted_employees(older_than: datetime, batch_size: int = 500) -> int:
+    """
+    Permanently remove employees soft-deleted before older_than.
+    Attendance is deleted in batches of batch_size, each in its own short
+    transaction, so the attendance table is never locked for long. Every
+    removed row gets a "purge" change-log entry in the same transaction.
+    Batches are locked with SKIP LOCKED on PostgreSQL, so concurrent purges
+    never pick up (and log) the same rows; SQLite serializes them instead.
+    Returns the number of employees purged.
+    """
+    db = SessionLocal()
+    purged = 0
+    try:
+        expired = (
+            select(Employee.employee_id)
+            .where(Employee.deleted_at.is_not(None), Employee.deleted_at < older_than)
+            .scalar_subquery()
         )
+        while True:
+            with serialized_write():
+                records = db.scalars(
+                    select(Attendance)
+                    .where(Attendance.employee_id.in_(expired))
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                ).all()
+                if not records:
+                    db.rollback()
+                    break
+                for record in records:
+                    record_change(
+                        db, "attendance", str(record.id), "purge",
+                        before=row_image(record), actor="system:purge",
+                    )
+                db.execute(delete(Attendance).where(Attendance.id.in_([r.id for r in records])))
+                db.commit()
+
+        while True:
+            with serialized_write():
+                employees = (
+                    db.query(Employee)
+                    .filter(Employee.deleted_at.is_not(None), Employee.deleted_at < older_than)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                    .all()
+                )
+                if not employees:
+                    db.rollback()
+                    break
+                for employee in employees:
+                    record_change(
+                        db, "employee", employee.employee_id, "purge",
+                        before=row_image(employee), actor="system:purge",
+                    )
+                db.execute(delete(Employee).where(Employee.id.in_([e.id for e in employees])))
+                db.commit()
+                purged += len(employees)
+    finally:
+        db.close()
 
-    db.delete(employee)
-    db.commit()
-    logger.info(f"Deleted employee: {employee.employee_id}")
-    return employee
+    logger.info(f"Purged {purged} offboarded employee(s) deleted before {older_than.isoformat()}")
+    return purged
@@ -0,0 +1,342 @@
+"""
+Report CRUD operations.
+Handles report job bookkeeping and the set-based monthly report queries.
+"""
+
+import calendar
+import csv
+import gzip
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import Date, Integer, case, cast, func, literal, or_
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.database import SessionLocal, date_of, is_sqlite, serialized_write
+from app.core.jobs import WORKER_ID, submit_job
+from app.models.attendance import Attendance
+from app.models.employee import Employee
+from app.models.report import ReportJob
+from app.schemas.report import ReportJobCreate
+
+logger = logging.getLogger(__name__)
+
+EMPLOYEE_REPORT_COLUMNS = [
+    "employee_id", "full_name", "department",
+    "present_days", "absent_days", "marked_days", "unmarked_days",
+]
+DEPARTMENT_REPORT_COLUMNS = [
+    "department", "employees",
+    "present_days", "absent_days", "marked_days", "unmarked_days",
+]
+
+ACTIVE_STATUSES = ["queued", "running"]
+INTERRUPTED_ERROR = "Interrupted: worker stopped responding."
+
+
+def _month_bounds(month: str) -> tuple[date, date]:
+    """Return the first and last day of a YYYY-MM month."""
+    year, month_number = (int(part) for part in month.split("-"))
+    last_day = calendar.monthrange(year, month_number)[1]
+    return date(year, month_number, 1), date(year, month_number, last_day)
+
+
+def _is_closed_month(month: str) -> bool:
+    """A month is closed once it has fully passed."""
+    return _month_bounds(month)[1] < date.today()
+
+
+def _attendance_counts():
+    """Aggregate columns over the attendance rows joined for the month."""
+    present = func.coalesce(func.sum(case((Attendance.status == "Present", 1), else_=0)), 0)
+    absent = func.coalesce(func.sum(case((Attendance.status == "Absent", 1), else_=0)), 0)
+    return (
+        present.label("present_days"),
+        absent.label("absent_days"),
+        func.count(Attendance.id).label("marked_days"),
+    )
+
+
+def _days_employed(start_date: date, end_date: date):
+    """
+    Days of the month the employee could have been marked, as SQL.
+    The range starts on the day they were added and ends at the earliest
+    of the month end, today and the day they were offboarded.
+    """
+    hired_on = date_of(Employee.created_at)
+    offboarded_on = date_of(Employee.deleted_at)
+    first_day = case((hired_on > start_date, hired_on), else_=literal(start_date, Date))
+    month_last_day = literal(min(end_date, date.today()), Date)
+    last_day = case(
+        (Employee.deleted_at.is_not(None) & (offboarded_on < month_last_day), offboarded_on),
+        else_=month_last_day,
+    )
+    if is_sqlite:
+        span = func.julianday(last_day) - func.julianday(first_day)
+        return cast(span, Integer) + 1
+    return last_day - first_day + 1
+
+
+def _monthly_join(query, start_date: date, end_date: date):
+    """
+    Outer join each employee to their attendance within the month.
+    Employees added after the month ended or offboarded before it
+    started are left out.
+    """
+    return query.outerjoin(
+        Attendance,
+        (Attendance.employee_id == Employee.employee_id)
+        & (Attendance.date >= start_date)
+        & (Attendance.date <= end_date),
+    ).filter(
+        date_of(Employee.created_at) <= end_date,
+        or_(Employee.deleted_at.is_(None), Employee.deleted_at >= start_date),
+    )
+
+
+def _employee_month_rows(db: Session, start_date: date, end_date: date):
+    """Per-employee totals for the month, including days they could be marked."""
+    query = db.query(
+        Employee.employee_id,
+        Employee.full_name,
+        Employee.department,
+        _days_employed(start_date, end_date).label("days_employed"),
+        *_attendance_counts(),
+    )
+    return _monthly_join(query, start_date, end_date).group_by(
+        Employee.id,
+        Employee.employee_id,
+        Employee.full_name,
+        Employee.department,
+        Employee.created_at,
+        Employee.deleted_at,
+    )
+
+
+def get_monthly_employee_report(db: Session, month: str) -> list[dict]:
+    """Per-employee attendance totals for a month, computed in one query."""
+    start_date, end_date = _month_bounds(month)
+    rows = _employee_month_rows(db, start_date, end_date).order_by(Employee.employee_id).all()
+    return [
+        {
+            "employee_id": row.employee_id,
+            "full_name": row.full_name,
+            "department": row.department,
+            "present_days": row.present_days,
+            "absent_days": row.absent_days,
+            "marked_days": row.marked_days,
+            "unmarked_days": row.days_employed - row.marked_days,
+        }
+        for row in rows
+    ]
+
+
+def get_monthly_department_report(db: Session, month: str) -> list[dict]:
+    """Per-department attendance totals for a month, computed in one query."""
+    start_date, end_date = _month_bounds(month)
+    per_employee = _employee_month_rows(db, start_date, end_date).subquery()
+    rows = (
+        db.query(
+            per_employee.c.department,
+            func.count().label("employees"),
+            func.sum(per_employee.c.present_days).label("present_days"),
+            func.sum(per_employee.c.absent_days).label("absent_days"),
+            func.sum(per_employee.c.marked_days).label("marked_days"),
+            func.sum(per_employee.c.days_employed - per_employee.c.marked_days).label("unmarked_days"),
+        )
+        .group_by(per_employee.c.department)
+        .order_by(per_employee.c.department)
+        .all()
+    )
+    return [row._asdict() for row in rows]
+
+
+def _stale_before() -> datetime:
+    """Heartbeats older than this mean the owning worker has gone away."""
+    return datetime.now(timezone.utc) - timedelta(seconds=3 * settings.JOB_HEARTBEAT_SECONDS)
+
+
+def _is_stale(job: ReportJob, stale_before: datetime) -> bool:
+    """Whether an active job's owner has stopped heartbeating."""
+    if job.heartbeat_at is None:
+        return True
+    heartbeat_at = job.heartbeat_at
+    # SQLite hands back naive timestamps; they are stored as UTC
+    if heartbeat_at.tzinfo is None:
+        heartbeat_at = heartbeat_at.replace(tzinfo=timezone.utc)
+    return heartbeat_at < stale_before
+
+
+def get_report_job(db: Session, job_id: int) -> ReportJob:
+    """
+    Retrieve a report job by ID.
+    Raises HTTPException if the job does not exist.
+    """
+    job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "message": f"Report job {job_id} not found.",
+            },
+        )
+    return job
+
+
+def create_report_job(db: Session, job_data: ReportJobCreate) -> tuple[ReportJob, bool]:
+    """
+    Queue a monthly report, or reuse an existing one.
+    A closed month reuses a stored artifact built after the month ended;
+    an identical job that is still queued or running is returned instead
+    of starting another, unless its worker has stopped heartbeating, in
+    which case it is failed and replaced. Returns the job and whether it
+    was reused.
+    """
+    if _month_bounds(job_data.month)[0] > date.today():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "message": f"Cannot report on future month {job_data.month}.",
+            },
+        )
+
+    with serialized_write():
+        candidates = (
+            db.query(ReportJob)
+            .filter(
+                ReportJob.kind == job_data.kind,
+                ReportJob.month == job_data.month,
+                ReportJob.status.in_([*ACTIVE_STATUSES, "completed"]),
+            )
+            .order_by(ReportJob.id.desc())
+            .all()
+        )
+        closed = _is_closed_month(job_data.month)
+        month_end = _month_bounds(job_data.month)[1]
+        stale_before = _stale_before()
+        for job in candidates:
+            if job.status in ACTIVE_STATUSES:
+                if not _is_stale(job, stale_before):
+                    return job, True
+                job.status = "failed"
+                job.error = INTERRUPTED_ERROR
+                continue
+            # A job started while the month was open misses its last days
+            if (
+                closed
+                and job.created_at.date() > month_end
+                and job.file_path
+                and os.path.exists(job.file_path)
+            ):
+                return job, True
+
+        job = ReportJob(
+            kind=job_data.kind,
+            month=job_data.month,
+            status="queued",
+            owner=WORKER_ID,
+            heartbeat_at=datetime.now(timezone.utc),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+    submit_job(run_report_job, job.id)
+    logger.info(f"Queued report job {job.id}: {job.kind} {job.month}")
+    return job, False
+
+
+def _write_csv_gz(path: str, columns: list[str], rows: list[dict]) -> None:
+    """Write rows as gzip-compressed CSV, replacing path atomically."""
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def _update_job(db: Session, job: ReportJob, **fields) -> None:
+    """Persist status fields on a job under the writer lock."""
+    with serialized_write():
+        # End any open read transaction so the write starts from a fresh snapshot
+        db.commit()
+        for name, value in fields.items():
+            setattr(job, name, value)
+        db.commit()
+
+
+def run_report_job(job_id: int) -> None:
+    """Background worker entry point: build one report and store it on disk."""
+    db = SessionLocal()
+    try:
+        job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+        if not job or job.status != "queued":
+            return
+        _update_job(db, job, status="running")
+
+        try:
+            if job.kind == "department":
+                columns = DEPARTMENT_REPORT_COLUMNS
+                rows = get_monthly_department_report(db, job.month)
+            else:
+                columns = EMPLOYEE_REPORT_COLUMNS
+                rows = get_monthly_employee_report(db, job.month)
+            # End the read transaction before the file write
+            db.commit()
+
+            os.makedirs(settings.REPORTS_DIR, exist_ok=True)
+            path = os.path.join(settings.REPORTS_DIR, f"{job.kind}-{job.month}-{job.id}.csv.gz")
+            _write_csv_gz(path, columns, rows)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Report job {job_id} failed: {e}", exc_info=True)
+            _update_job(db, job, status="failed", error=str(e), completed_at=datetime.now(timezone.utc))
+            return
+
+        _update_job(db, job, status="completed", file_path=path, completed_at=datetime.now(timezone.utc))
+        logger.info(f"Completed report job {job.id}: {len(rows)} rows -> {path}")
+    finally:
+        db.close()
+
+
+def heartbeat_report_jobs() -> int:
+    """Refresh heartbeat_at on the active jobs this process owns."""
+    db = SessionLocal()
+    try:
+        with serialized_write():
+            count = (
+                db.query(ReportJob)
+                .filter(ReportJob.status.in_(ACTIVE_STATUSES), ReportJob.owner == WORKER_ID)
+                .update({"heartbeat_at": datetime.now(timezone.utc)}, synchronize_session=False)
+            )
+            db.commit()
+        return count
+    finally:
+        db.close()
+
+
+def fail_interrupted_report_jobs(db: Session) -> int:
+    """
+    Mark jobs whose owning process has stopped heartbeating as failed.
+    Jobs queued or run by other live workers keep their status.
+    """
+    stale_before = _stale_before()
+    with serialized_write():
+        count = (
+            db.query(ReportJob)
+            .filter(
+                ReportJob.status.in_(ACTIVE_STATUSES),
+                or_(ReportJob.heartbeat_at.is_(None), ReportJob.heartbeat_at < stale_before),
+            )
+            .update(
+                {"status": "failed", "error": INTERRUPTED_ERROR},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+    return count
@@ -11,9 +11,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
+from app.core.admission import AdmissionControlMiddleware
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.api.routes import employees, attendance
+from app.core.database import engine, Base, SessionLocal, POOL_SIZE, POOL_MAX_OVERFLOW
+from app.core.jobs import shutdown_jobs, start_heartbeat
+from app.crud.report import fail_interrupted_report_jobs, heartbeat_report_jobs
+from app.api.routes import employees, attendance, reports, audit
 
 # Configure logging
 logging.basicConfig(
@@ -25,12 +28,21 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan — create tables on startup."""
+    """Application lifespan — create tables on startup, stop background jobs on shutdown."""
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created successfully.")
+    db = SessionLocal()
+    try:
+        interrupted = fail_interrupted_report_jobs(db)
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted report job(s) as failed.")
+    finally:
+        db.close()
+    start_heartbeat(heartbeat_report_jobs)
     yield
     logger.info("Application shutting down.")
+    shutdown_jobs()
 
 
 # Create FastAPI application
@@ -41,6 +53,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# ----- Admission Control Middleware -----
+# Added before CORS so rejections still carry CORS headers
+app.add_middleware(
+    AdmissionControlMiddleware,
+    pool=engine.pool,
+    pool_capacity=POOL_SIZE + POOL_MAX_OVERFLOW,
+)
+
 # ----- CORS Middleware -----
 app.add_middleware(
     CORSMiddleware,
@@ -84,6 +104,8 @@ async def general_exception_handler(request: Request, exc: Exception):
 # ----- Register Routers -----
 app.include_router(employees.router)
 app.include_router(attendance.router)
+app.include_router(reports.router)
+app.include_router(audit.router)
 
 
 # ----- Health Check -----
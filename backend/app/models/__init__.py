@@ -1,4 +1,6 @@
 from app.models.employee import Employee
 from app.models.attendance import Attendance
+from app.models.report import ReportJob
+from app.models.change_log import ChangeLog
 
-__all__ = ["Employee", "Attendance"]
+__all__ = ["Employee", "Attendance", "ReportJob", "ChangeLog"]
@@ -24,6 +24,13 @@ class Attendance(Base):
     date = Column(Date, nullable=False)
     status = Column(String(10), nullable=False)  # "Present" or "Absent"
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped on every write; drives ?since= delta sync on the list endpoints
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        index=True,
+    )
 
     # Unique constraint: one attendance record per employee per date
     __table_args__ = (
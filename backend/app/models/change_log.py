@@ -0,0 +1,30 @@
+"""
+ChangeLog SQLAlchemy model.
+Represents the append-only change_log audit table in the database.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from app.core.database import Base
+
+
+class ChangeLog(Base):
+    """Audit entry recording one mutation of an employee or attendance row."""
+
+    __tablename__ = "change_log"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(20), nullable=False)  # "employee" or "attendance"
+    entity_key = Column(String(50), nullable=False)
+    action = Column(String(10), nullable=False)  # "create" or "delete"
+    actor = Column(String(255), nullable=True)
+    before = Column(JSON, nullable=True)
+    after = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Time-range queries page by (created_at, id)
+    __table_args__ = (
+        Index("ix_change_log_created_at_id", "created_at", "id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ChangeLog(id={self.id}, entity='{self.entity}', key='{self.entity_key}', action='{self.action}')>"
@@ -3,7 +3,8 @@ Employee SQLAlchemy model.
 Represents the employees table in the database.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -17,9 +18,44 @@ class Employee(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     employee_id = Column(String(50), unique=True, nullable=False, index=True)
     full_name = Column(String(255), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     department = Column(String(100), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped on every write; drives ?since= delta sync on the list endpoints
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        index=True,
+    )
+    # Set when the employee is offboarded; the row and its attendance stay
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Partial indexes cover only active rows, so listings and uniqueness
+    # checks do not grow with offboarded history. employee_id stays
+    # globally unique because attendance references it.
+    __table_args__ = (
+        Index(
+            "uq_employees_active_email",
+            "email",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_employees_active_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # Finds purge candidates without indexing the active majority
+        Index(
+            "ix_employees_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     # Relationship to attendance records
     attendance_records = relationship(
@@ -28,5 +64,14 @@ class Employee(Base):
         cascade="all, delete-orphan",
     )
 
+    @hybrid_property
+    def is_active(self) -> bool:
+        """Whether the employee has not been offboarded."""
+        return self.deleted_at is None
+
+    @is_active.expression
+    def is_active(cls):
+        return cls.deleted_at.is_(None)
+
     def __repr__(self) -> str:
         return f"<Employee(id={self.id}, employee_id='{self.employee_id}', name='{self.full_name}')>"
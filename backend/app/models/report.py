@@ -0,0 +1,36 @@
+"""
+ReportJob SQLAlchemy model.
+Represents the report_jobs table tracking background report generation.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class ReportJob(Base):
+    """Background report job database model."""
+
+    __tablename__ = "report_jobs"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)  # "employee" or "department"
+    month = Column(String(7), nullable=False)  # "YYYY-MM"
+    status = Column(String(20), nullable=False, default="queued")  # queued/running/completed/failed
+    file_path = Column(String(500), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Process that queued the job and the last time it confirmed it is alive
+    owner = Column(String(100), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Lookup of an existing artifact for the same report
+    __table_args__ = (
+        Index("ix_report_jobs_kind_month", "kind", "month"),
+        # Heartbeat updates and the startup scan for interrupted jobs
+        Index("ix_report_jobs_status_owner", "status", "owner"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ReportJob(id={self.id}, kind='{self.kind}', month='{self.month}', status='{self.status}')>"
@@ -4,7 +4,7 @@ Attendance Pydantic schemas for request/response validation.
 
 import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class AttendanceCreate(BaseModel):
@@ -46,6 +46,7 @@ class AttendanceResponse(BaseModel):
     date: datetime.date
     status: str
     created_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = None
 
     class Config:
         from_attributes = True
@@ -57,4 +58,66 @@ class AttendanceListResponse(BaseModel):
     success: bool = True
     data: list[AttendanceResponse]
     count: int
+    # Delta responses only: ids deleted since the requested timestamp
+    deleted_ids: list[int] = []
+    # Pass back as ?since= to receive only later changes
+    server_time: Optional[datetime.datetime] = None
 
+
+class AttendanceBatchQuery(BaseModel):
+    """Schema for querying attendance of several employees at once."""
+
+    employee_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Employee identifiers to fetch attendance for",
+        examples=[["EMP001", "EMP002"]],
+    )
+    start_date: Optional[datetime.date] = Field(
+        None,
+        description="Inclusive lower bound on attendance date",
+        examples=["2026-02-01"],
+    )
+    end_date: Optional[datetime.date] = Field(
+        None,
+        description="Inclusive upper bound on attendance date",
+        examples=["2026-02-28"],
+    )
+
+    @model_validator(mode="after")
+    def validate_date_range(self) -> "AttendanceBatchQuery":
+        """Ensure start_date is not after end_date."""
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValueError("start_date must be on or before end_date")
+        return self
+
+
+class AttendanceBatchResponse(BaseModel):
+    """Schema for attendance records grouped per employee."""
+
+    success: bool = True
+    data: dict[str, list[AttendanceResponse]]
+    unknown_employee_ids: list[str]
+    count: int
+
+
+class UnmarkedAttendanceResponse(BaseModel):
+    """Schema for an employee with no attendance record on a given date."""
+
+    date: datetime.date
+    employee_id: str
+    full_name: str
+    department: str
+
+    class Config:
+        from_attributes = True
+
+
+class UnmarkedAttendanceListResponse(BaseModel):
+    """Schema for a keyset-paginated page of unmarked attendance."""
+
+    success: bool = True
+    data: list[UnmarkedAttendanceResponse]
+    count: int
+    next_cursor: Optional[str] = None
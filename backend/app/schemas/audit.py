@@ -0,0 +1,32 @@
+"""
+Audit log Pydantic schemas for response serialization.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel
+
+
+class ChangeLogResponse(BaseModel):
+    """Schema for a single audit entry."""
+
+    id: int
+    entity: str
+    entity_key: str
+    action: str
+    actor: Optional[str] = None
+    before: Optional[dict[str, Any]] = None
+    after: Optional[dict[str, Any]] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ChangeLogListResponse(BaseModel):
+    """Schema for a keyset-paginated page of audit entries."""
+
+    success: bool = True
+    data: list[ChangeLogResponse]
+    count: int
+    next_cursor: Optional[str] = None
@@ -47,6 +47,7 @@ class EmployeeResponse(BaseModel):
     email: str
     department: str
     created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -58,6 +59,10 @@ class EmployeeListResponse(BaseModel):
     success: bool = True
     data: list[EmployeeResponse]
     count: int
+    # Delta responses only: ids deleted since the requested timestamp
+    deleted_ids: list[int] = []
+    # Pass back as ?since= to receive only later changes
+    server_time: Optional[datetime] = None
 
 
 class EmployeeSingleResponse(BaseModel):
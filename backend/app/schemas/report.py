@@ -0,0 +1,64 @@
+"""
+Report Pydantic schemas for request/response validation.
+"""
+
+import re
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+
+
+class ReportJobCreate(BaseModel):
+    """Schema for requesting a monthly attendance report."""
+
+    month: str = Field(
+        ...,
+        description="Report month in YYYY-MM format",
+        examples=["2026-02"],
+    )
+    kind: str = Field(
+        "employee",
+        description="Report granularity: employee or department",
+        examples=["employee"],
+    )
+
+    @field_validator("month")
+    @classmethod
+    def validate_month(cls, v: str) -> str:
+        """Ensure month is formatted as YYYY-MM."""
+        if not re.fullmatch(r"\d{4}-(0[1-9]|1[0-2])", v):
+            raise ValueError("Month must be in YYYY-MM format")
+        return v
+
+    @field_validator("kind")
+    @classmethod
+    def validate_kind(cls, v: str) -> str:
+        """Ensure kind is either 'employee' or 'department'."""
+        allowed = {"employee", "department"}
+        if v not in allowed:
+            raise ValueError(f"Kind must be one of: {', '.join(allowed)}")
+        return v
+
+
+class ReportJobResponse(BaseModel):
+    """Schema for report job response."""
+
+    id: int
+    kind: str
+    month: str
+    status: str
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ReportJobSingleResponse(BaseModel):
+    """Schema for single report job response."""
+
+    success: bool = True
+    data: ReportJobResponse
+    # True when an existing artifact for a closed month was reused
+    cached: bool = False
@@ -0,0 +1,21 @@
+"""
+Client identification helpers.
+Shared by admission control and the audit actor dependency.
+"""
+
+from app.core.config import settings
+
+
+def resolve_client_ip(forwarded_for: str | None, peer: str | None) -> str:
+    """
+    Determine the caller's address.
+    X-Forwarded-For is only trusted for the hops our own proxies appended
+    (TRUSTED_PROXY_HOPS); entries further left are client-controlled and
+    ignored. Without trusted proxies the socket peer is used.
+    """
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops > 0 and forwarded_for:
+        entries = [entry.strip() for entry in forwarded_for.split(",") if entry.strip()]
+        if len(entries) >= hops:
+            return entries[-hops]
+    return peer or "unknown"
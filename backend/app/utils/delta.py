@@ -0,0 +1,25 @@
+"""
+Delta sync helpers.
+Shared by the list endpoints that accept a ?since= timestamp.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+
+
+def server_now() -> datetime:
+    """Current UTC time, returned to clients as the next ?since= value."""
+    return datetime.now(timezone.utc)
+
+
+def delta_cutoff(since: datetime) -> datetime:
+    """
+    Convert a client's ?since= value into the updated_at lower bound.
+    Normalises to naive UTC (SQLite stores CURRENT_TIMESTAMP that way) and
+    steps back by the overlap window; clients upsert by id, so rows sent
+    twice are harmless.
+    """
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
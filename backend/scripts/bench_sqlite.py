@@ -0,0 +1,103 @@
+"""
+SQLite concurrency benchmark.
+Runs concurrent create_attendance writers alongside full-scan readers
+against a throwaway SQLite database and reports throughput and errors.
+
+Usage (from backend/):
+    python -m scripts.bench_sqlite [--writers 16] [--writes 40] [--readers 4]
+
+Run it on two checkouts to compare before/after a database change.
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writers", type=int, default=16, help="Concurrent writer threads")
+    parser.add_argument("--writes", type=int, default=40, help="Attendance rows per writer")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent full-scan reader threads")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="hrms-bench-")
+    # Must be set before the app modules create the engine
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    from app.core.database import Base, SessionLocal, engine
+    from app.crud.attendance import create_attendance, get_all_attendance
+    from app.models import Employee
+    from app.schemas.attendance import AttendanceCreate
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    for i in range(args.writers):
+        db.add(Employee(employee_id=f"E{i}", full_name="Bench", email=f"e{i}@bench.local", department="Bench"))
+    db.commit()
+    db.close()
+
+    counts = {"writes": 0, "write_errors": 0, "reads": 0, "read_errors": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def bump(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def writer(index: int) -> None:
+        for day in range(args.writes):
+            session = SessionLocal()
+            try:
+                create_attendance(
+                    session,
+                    AttendanceCreate(
+                        employee_id=f"E{index}",
+                        date=datetime.date(2026, 1, 1) + datetime.timedelta(days=day),
+                        status="Present",
+                    ),
+                )
+                bump("writes")
+            except Exception:
+                bump("write_errors")
+            finally:
+                session.close()
+
+    def reader() -> None:
+        while not stop.is_set():
+            session = SessionLocal()
+            try:
+                get_all_attendance(session)
+                bump("reads")
+            except Exception:
+                bump("read_errors")
+            finally:
+                session.close()
+
+    writers = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    readers = [threading.Thread(target=reader) for _ in range(args.readers)]
+    started = time.perf_counter()
+    for thread in writers + readers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    print(
+        f"{elapsed:.2f}s  "
+        f"writes={counts['writes']} ({counts['writes'] / elapsed:.0f}/s) write_errors={counts['write_errors']}  "
+        f"reads={counts['reads']} ({counts['reads'] / elapsed:.0f}/s) read_errors={counts['read_errors']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
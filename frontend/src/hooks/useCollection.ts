@@ -0,0 +1,33 @@
+/**
+ * React binding for the client-side data cache.
+ * Renders cached rows immediately and revalidates in the background.
+ */
+
+import { useCallback, useEffect, useState, useSyncExternalStore } from 'react';
+import type { Collection } from '../services/cache';
+
+export default function useCollection<T extends { id: number }>(collection: Collection<T>) {
+    const data = useSyncExternalStore(collection.subscribe, collection.getSnapshot);
+    const [error, setError] = useState(false);
+
+    const refresh = useCallback(async () => {
+        setError(false);
+        try {
+            await collection.revalidate();
+        } catch {
+            // Keep serving cached rows when offline; only fail with nothing to show
+            if (!collection.isLoaded()) setError(true);
+        }
+    }, [collection]);
+
+    useEffect(() => {
+        refresh();
+    }, [refresh]);
+
+    return {
+        data,
+        loading: !collection.isLoaded() && !error,
+        error,
+        refresh,
+    };
+}
@@ -7,6 +7,7 @@ import { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Save, ArrowLeft } from 'lucide-react';
 import { createEmployee } from '../services/api';
+import { employeeCache } from '../services/cache';
 import type { EmployeeCreate } from '../types';
 import PageHeader from '../components/PageHeader';
 import toast from 'react-hot-toast';
@@ -65,7 +66,8 @@ export default function AddEmployeePage() {
 
         setSubmitting(true);
         try {
-            await createEmployee(form);
+            const res = await createEmployee(form);
+            employeeCache.upsert([res.data]);
             toast.success('Employee added successfully!');
             navigate('/employees');
         } catch (err) {
@@ -3,15 +3,12 @@
  * Mark attendance for employees and view attendance records.
  */
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useMemo } from 'react';
 import { Calendar, Filter } from 'lucide-react';
-import {
-    getEmployees,
-    getAllAttendance,
-    getAttendanceByEmployee,
-    markAttendance,
-} from '../services/api';
-import type { Employee, Attendance, AttendanceCreate } from '../types';
+import { markAttendance } from '../services/api';
+import { employeeCache, attendanceCache } from '../services/cache';
+import useCollection from '../hooks/useCollection';
+import type { AttendanceCreate } from '../types';
 import PageHeader from '../components/PageHeader';
 import LoadingSpinner from '../components/LoadingSpinner';
 import EmptyState from '../components/EmptyState';
@@ -21,10 +18,8 @@ import toast from 'react-hot-toast';
 import axios from 'axios';
 
 export default function AttendancePage() {
-    const [employees, setEmployees] = useState<Employee[]>([]);
-    const [records, setRecords] = useState<Attendance[]>([]);
-    const [loading, setLoading] = useState(true);
-    const [error, setError] = useState('');
+    const { data: employees, ...employeesQuery } = useCollection(employeeCache);
+    const { data: allRecords, ...attendanceQuery } = useCollection(attendanceCache);
     const [filterEmployee, setFilterEmployee] = useState('');
     const [submitting, setSubmitting] = useState(false);
 
@@ -36,46 +31,19 @@ export default function AttendancePage() {
     });
     const [formErrors, setFormErrors] = useState<Record<string, string>>({});
 
-    const fetchData = useCallback(async () => {
-        setLoading(true);
-        setError('');
-        try {
-            const [empRes, attRes] = await Promise.all([
-                getEmployees(),
-                getAllAttendance(),
-            ]);
-            setEmployees(empRes.data || []);
-            setRecords(attRes.data || []);
-        } catch {
-            setError('Failed to load data.');
-        } finally {
-            setLoading(false);
-        }
-    }, []);
-
-    useEffect(() => {
-        fetchData();
-    }, [fetchData]);
+    // Filter attendance records by employee from the shared cache
+    const records = useMemo(
+        () => (filterEmployee ? allRecords.filter((r) => r.employee_id === filterEmployee) : allRecords),
+        [allRecords, filterEmployee],
+    );
 
-    // Filter attendance records by employee
-    const handleFilterChange = async (employeeId: string) => {
+    const handleFilterChange = (employeeId: string) => {
         setFilterEmployee(employeeId);
-        if (!employeeId) {
-            // Reset to all records
-            try {
-                const res = await getAllAttendance();
-                setRecords(res.data);
-            } catch {
-                toast.error('Failed to fetch records.');
-            }
-            return;
-        }
-        try {
-            const res = await getAttendanceByEmployee(employeeId);
-            setRecords(res.data);
-        } catch {
-            toast.error('Failed to fetch attendance for this employee.');
-        }
+    };
+
+    const refresh = () => {
+        employeesQuery.refresh();
+        attendanceQuery.refresh();
     };
 
     const validate = (): boolean => {
@@ -93,16 +61,9 @@ export default function AttendancePage() {
 
         setSubmitting(true);
         try {
-            await markAttendance(form);
+            const created = await markAttendance(form);
             toast.success('Attendance marked successfully!');
-            // Refresh records
-            if (filterEmployee) {
-                const res = await getAttendanceByEmployee(filterEmployee);
-                setRecords(res.data);
-            } else {
-                const res = await getAllAttendance();
-                setRecords(res.data);
-            }
+            attendanceCache.upsert([created]);
             // Reset form
             setForm((prev) => ({ ...prev, employee_id: '' }));
         } catch (err) {
@@ -118,8 +79,12 @@ export default function AttendancePage() {
         }
     };
 
-    if (loading) return <LoadingSpinner message="Loading attendance data..." />;
-    if (error) return <ErrorAlert message={error} onRetry={fetchData} />;
+    if (employeesQuery.loading || attendanceQuery.loading) {
+        return <LoadingSpinner message="Loading attendance data..." />;
+    }
+    if (employeesQuery.error || attendanceQuery.error) {
+        return <ErrorAlert message="Failed to load data." onRetry={refresh} />;
+    }
 
     // Helper: get employee name by ID
     const getEmployeeName = (empId: string): string => {
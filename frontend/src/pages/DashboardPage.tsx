@@ -3,11 +3,10 @@
  * Shows counts for employees, today's attendance, and present/absent breakdown.
  */
 
-import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import { Users, ClipboardCheck, UserCheck, UserX, ArrowRight } from 'lucide-react';
-import { getEmployees, getAllAttendance } from '../services/api';
-import type { Employee, Attendance } from '../types';
+import { employeeCache, attendanceCache } from '../services/cache';
+import useCollection from '../hooks/useCollection';
 import PageHeader from '../components/PageHeader';
 import LoadingSpinner from '../components/LoadingSpinner';
 import ErrorAlert from '../components/ErrorAlert';
@@ -38,34 +37,22 @@ function StatCard({ title, value, icon: Icon, color, bgColor, iconBg }: StatCard
 }
 
 export default function DashboardPage() {
-    const [employees, setEmployees] = useState<Employee[]>([]);
-    const [attendance, setAttendance] = useState<Attendance[]>([]);
-    const [loading, setLoading] = useState(true);
-    const [error, setError] = useState('');
+    const employeesQuery = useCollection(employeeCache);
+    const attendanceQuery = useCollection(attendanceCache);
+    const employees = employeesQuery.data;
+    const attendance = attendanceQuery.data;
 
-    const fetchData = async () => {
-        setLoading(true);
-        setError('');
-        try {
-            const [empRes, attRes] = await Promise.all([
-                getEmployees(),
-                getAllAttendance(),
-            ]);
-            setEmployees(empRes.data || []);
-            setAttendance(attRes.data || []);
-        } catch {
-            setError('Failed to load dashboard data.');
-        } finally {
-            setLoading(false);
-        }
+    const refresh = () => {
+        employeesQuery.refresh();
+        attendanceQuery.refresh();
     };
 
-    useEffect(() => {
-        fetchData();
-    }, []);
-
-    if (loading) return <LoadingSpinner message="Loading dashboard..." />;
-    if (error) return <ErrorAlert message={error} onRetry={fetchData} />;
+    if (employeesQuery.loading || attendanceQuery.loading) {
+        return <LoadingSpinner message="Loading dashboard..." />;
+    }
+    if (employeesQuery.error || attendanceQuery.error) {
+        return <ErrorAlert message="Failed to load dashboard data." onRetry={refresh} />;
+    }
 
     const today = new Date().toISOString().split('T')[0];
     const todayAttendance = attendance.filter((a) => a.date === today);
@@ -6,7 +6,9 @@
 import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import { Plus, Trash2, Search } from 'lucide-react';
-import { getEmployees, deleteEmployee } from '../services/api';
+import { deleteEmployee } from '../services/api';
+import { employeeCache } from '../services/cache';
+import useCollection from '../hooks/useCollection';
 import type { Employee } from '../types';
 import PageHeader from '../components/PageHeader';
 import LoadingSpinner from '../components/LoadingSpinner';
@@ -16,32 +18,12 @@ import ConfirmModal from '../components/ConfirmModal';
 import toast from 'react-hot-toast';
 
 export default function EmployeeListPage() {
-    const [employees, setEmployees] = useState<Employee[]>([]);
+    const { data: employees, loading, error, refresh } = useCollection(employeeCache);
     const [filtered, setFiltered] = useState<Employee[]>([]);
     const [search, setSearch] = useState('');
-    const [loading, setLoading] = useState(true);
-    const [error, setError] = useState('');
     const [deleteTarget, setDeleteTarget] = useState<Employee | null>(null);
     const [deleting, setDeleting] = useState(false);
 
-    const fetchEmployees = async () => {
-        setLoading(true);
-        setError('');
-        try {
-            const res = await getEmployees();
-            setEmployees(res.data || []);
-            setFiltered(res.data || []);
-        } catch {
-            setError('Failed to load employees.');
-        } finally {
-            setLoading(false);
-        }
-    };
-
-    useEffect(() => {
-        fetchEmployees();
-    }, []);
-
     // Search filter
     useEffect(() => {
         if (!search.trim()) {
@@ -66,7 +48,8 @@ export default function EmployeeListPage() {
         try {
             await deleteEmployee(deleteTarget.id);
             toast.success(`Employee "${deleteTarget.full_name}" deleted.`);
-            setEmployees((prev) => prev.filter((e) => e.id !== deleteTarget.id));
+            // Offboarding is a soft delete; the employee's attendance history stays
+            employeeCache.remove((e) => e.id === deleteTarget.id);
             setDeleteTarget(null);
         } catch {
             toast.error('Failed to delete employee.');
@@ -76,7 +59,7 @@ export default function EmployeeListPage() {
     };
 
     if (loading) return <LoadingSpinner message="Loading employees..." />;
-    if (error) return <ErrorAlert message={error} onRetry={fetchEmployees} />;
+    if (error) return <ErrorAlert message="Failed to load employees." onRetry={refresh} />;
 
     return (
         <div>
@@ -207,7 +190,7 @@ export default function EmployeeListPage() {
             <ConfirmModal
                 isOpen={!!deleteTarget}
                 title="Delete Employee"
-                message={`Are you sure you want to delete "${deleteTarget?.full_name}"? This will also remove all their attendance records. This action cannot be undone.`}
+                message={`Are you sure you want to delete "${deleteTarget?.full_name}"? They will be removed from the directory; their attendance history is kept for records.`}
                 onConfirm={handleDelete}
                 onCancel={() => setDeleteTarget(null)}
                 isLoading={deleting}
@@ -9,6 +9,7 @@ import type {
     EmployeeCreate,
     Attendance,
     AttendanceCreate,
+    UnmarkedAttendanceResponse,
     ApiListResponse,
     ApiSingleResponse,
     ApiDeleteResponse,
@@ -32,9 +33,11 @@ export const createEmployee = async (data: EmployeeCreate): Promise<ApiSingleRes
     return response.data;
 };
 
-/** Get all employees */
-export const getEmployees = async (): Promise<ApiListResponse<Employee>> => {
-    const response = await api.get<ApiListResponse<Employee>>('/api/employees');
+/** Get all employees, or only those changed since a previous server_time */
+export const getEmployees = async (since?: string): Promise<ApiListResponse<Employee>> => {
+    const response = await api.get<ApiListResponse<Employee>>('/api/employees', {
+        params: { since },
+    });
     return response.data;
 };
 
@@ -44,6 +47,18 @@ export const deleteEmployee = async (id: number): Promise<ApiDeleteResponse> =>
     return response.data;
 };
 
+/** Get employees with no attendance marked between two dates (inclusive) */
+export const getUnmarkedEmployees = async (
+    startDate: string,
+    endDate?: string,
+    cursor?: string,
+): Promise<UnmarkedAttendanceResponse> => {
+    const response = await api.get<UnmarkedAttendanceResponse>('/api/employees/unmarked', {
+        params: { start_date: startDate, end_date: endDate, cursor },
+    });
+    return response.data;
+};
+
 // -------- Attendance API --------
 
 /** Mark attendance for an employee */
@@ -52,9 +67,11 @@ export const markAttendance = async (data: AttendanceCreate): Promise<Attendance
     return response.data;
 };
 
-/** Get all attendance records */
-export const getAllAttendance = async (): Promise<ApiListResponse<Attendance>> => {
-    const response = await api.get<ApiListResponse<Attendance>>('/api/attendance');
+/** Get all attendance records, or only those changed since a previous server_time */
+export const getAllAttendance = async (since?: string): Promise<ApiListResponse<Attendance>> => {
+    const response = await api.get<ApiListResponse<Attendance>>('/api/attendance', {
+        params: { since },
+    });
     return response.data;
 };
 
@@ -0,0 +1,234 @@
+/**
+ * Client-side data cache.
+ * Normalised, ID-keyed stores for employees and attendance, persisted to
+ * IndexedDB and kept fresh with stale-while-revalidate delta syncs.
+ */
+
+import { getEmployees, getAllAttendance } from './api';
+import type { Employee, Attendance, ApiListResponse } from '../types';
+
+const DB_NAME = 'hrms-lite-cache';
+const DB_VERSION = 1;
+const META_STORE = 'meta';
+const ENTITY_STORES = ['employees', 'attendance'];
+
+type Listener = () => void;
+
+// -------- IndexedDB persistence --------
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+/** Open the cache database, or resolve null when IndexedDB is unavailable */
+function openDatabase(): Promise<IDBDatabase | null> {
+    if (!dbPromise) {
+        dbPromise = new Promise((resolve) => {
+            if (typeof indexedDB === 'undefined') {
+                resolve(null);
+                return;
+            }
+            const request = indexedDB.open(DB_NAME, DB_VERSION);
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                for (const name of ENTITY_STORES) {
+                    if (!db.objectStoreNames.contains(name)) {
+                        db.createObjectStore(name, { keyPath: 'id' });
+                    }
+                }
+                if (!db.objectStoreNames.contains(META_STORE)) {
+                    db.createObjectStore(META_STORE);
+                }
+            };
+            request.onsuccess = () => resolve(request.result);
+            // Private browsing or blocked storage: fall back to memory only
+            request.onerror = () => resolve(null);
+        });
+    }
+    return dbPromise;
+}
+
+function requestResult<T>(request: IDBRequest<T>): Promise<T> {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+/** Load persisted rows and the last sync marker for a store */
+async function readPersisted<T>(store: string): Promise<{ rows: T[]; lastSync: string | null }> {
+    const db = await openDatabase();
+    if (!db) return { rows: [], lastSync: null };
+    try {
+        const tx = db.transaction([store, META_STORE], 'readonly');
+        const [rows, lastSync] = await Promise.all([
+            requestResult(tx.objectStore(store).getAll() as IDBRequest<T[]>),
+            requestResult(tx.objectStore(META_STORE).get(store) as IDBRequest<string | undefined>),
+        ]);
+        return { rows, lastSync: lastSync ?? null };
+    } catch {
+        return { rows: [], lastSync: null };
+    }
+}
+
+/** Apply a change set to a persisted store; failures only cost the offline copy */
+async function writePersisted<T>(
+    store: string,
+    changes: { put?: T[]; remove?: number[]; replace?: boolean; lastSync?: string | null },
+): Promise<void> {
+    const db = await openDatabase();
+    if (!db) return;
+    try {
+        const tx = db.transaction([store, META_STORE], 'readwrite');
+        const objects = tx.objectStore(store);
+        if (changes.replace) objects.clear();
+        changes.put?.forEach((row) => objects.put(row));
+        changes.remove?.forEach((id) => objects.delete(id));
+        if (changes.lastSync) tx.objectStore(META_STORE).put(changes.lastSync, store);
+        await new Promise<void>((resolve) => {
+            tx.oncomplete = () => resolve();
+            tx.onerror = () => resolve();
+            tx.onabort = () => resolve();
+        });
+    } catch {
+        // Ignore: the in-memory cache stays authoritative for this session
+    }
+}
+
+// -------- Request deduplication --------
+
+const inFlight = new Map<string, Promise<unknown>>();
+
+/** Share one pending promise between concurrent callers using the same key */
+export function dedupe<T>(key: string, fn: () => Promise<T>): Promise<T> {
+    const pending = inFlight.get(key);
+    if (pending) return pending as Promise<T>;
+    const promise = fn().finally(() => inFlight.delete(key));
+    inFlight.set(key, promise);
+    return promise;
+}
+
+// -------- Normalised collection --------
+
+/**
+ * ID-keyed cache of one entity type.
+ * Readers get the cached snapshot immediately; revalidate() fetches the
+ * delta since the last sync, upserting changed rows and dropping the
+ * ids the server reports as deleted.
+ */
+export class Collection<T extends { id: number }> {
+    private readonly name: string;
+    private readonly fetchList: (since?: string) => Promise<ApiListResponse<T>>;
+    private readonly compare: (a: T, b: T) => number;
+    private rows = new Map<number, T>();
+    private snapshot: T[] = [];
+    private listeners = new Set<Listener>();
+    private hydration: Promise<void> | null = null;
+    private lastSync: string | null = null;
+    private loaded = false;
+
+    constructor(
+        name: string,
+        fetchList: (since?: string) => Promise<ApiListResponse<T>>,
+        compare: (a: T, b: T) => number,
+    ) {
+        this.name = name;
+        this.fetchList = fetchList;
+        this.compare = compare;
+    }
+
+    /** Register a change listener; returns the unsubscribe function */
+    subscribe = (listener: Listener): (() => void) => {
+        this.listeners.add(listener);
+        return () => {
+            this.listeners.delete(listener);
+        };
+    };
+
+    /** Current rows in display order (stable reference between changes) */
+    getSnapshot = (): T[] => this.snapshot;
+
+    /** Whether rows have been loaded from IndexedDB or the server */
+    isLoaded(): boolean {
+        return this.loaded;
+    }
+
+    /** Fetch changes from the server, deduplicating concurrent calls */
+    revalidate(): Promise<void> {
+        return dedupe(this.name, async () => {
+            await this.hydrate();
+            if (this.lastSync) {
+                const delta = await this.fetchList(this.lastSync);
+                const deletedIds = delta.deleted_ids ?? [];
+                this.merge(delta.data);
+                deletedIds.forEach((id) => this.rows.delete(id));
+                this.markSynced(delta.server_time, { put: delta.data, remove: deletedIds });
+                return;
+            }
+            const full = await this.fetchList();
+            this.rows = new Map(full.data.map((row) => [row.id, row]));
+            this.markSynced(full.server_time, { put: full.data, replace: true });
+        });
+    }
+
+    /** Insert or replace rows after a local mutation */
+    upsert(rows: T[]): void {
+        this.merge(rows);
+        this.emit();
+        void writePersisted(this.name, { put: rows });
+    }
+
+    /** Drop rows matching a predicate after a local mutation */
+    remove(predicate: (row: T) => boolean): void {
+        const ids = [...this.rows.values()].filter(predicate).map((row) => row.id);
+        if (ids.length === 0) return;
+        ids.forEach((id) => this.rows.delete(id));
+        this.emit();
+        void writePersisted(this.name, { remove: ids });
+    }
+
+    private hydrate(): Promise<void> {
+        if (!this.hydration) {
+            this.hydration = readPersisted<T>(this.name).then(({ rows, lastSync }) => {
+                // A server response may have landed first; never overwrite it
+                if (this.loaded || rows.length === 0) return;
+                this.merge(rows);
+                this.lastSync = lastSync;
+                this.loaded = true;
+                this.emit();
+            });
+        }
+        return this.hydration;
+    }
+
+    private merge(rows: T[]): void {
+        rows.forEach((row) => this.rows.set(row.id, row));
+    }
+
+    private markSynced(
+        serverTime: string | undefined,
+        changes: { put: T[]; remove?: number[]; replace?: boolean },
+    ): void {
+        this.lastSync = serverTime ?? null;
+        this.loaded = true;
+        this.emit();
+        void writePersisted(this.name, { ...changes, lastSync: this.lastSync });
+    }
+
+    private emit(): void {
+        this.snapshot = [...this.rows.values()].sort(this.compare);
+        this.listeners.forEach((listener) => listener());
+    }
+}
+
+/** Employees, newest first */
+export const employeeCache = new Collection<Employee>(
+    'employees',
+    getEmployees,
+    (a, b) => (b.created_at ?? '').localeCompare(a.created_at ?? '') || b.id - a.id,
+);
+
+/** Attendance records, newest date first */
+export const attendanceCache = new Collection<Attendance>(
+    'attendance',
+    getAllAttendance,
+    (a, b) => b.date.localeCompare(a.date) || b.id - a.id,
+);
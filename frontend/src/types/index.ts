@@ -10,6 +10,7 @@ export interface Employee {
     email: string;
     department: string;
     created_at: string;
+    updated_at: string;
 }
 
 /** Payload for creating an employee */
@@ -27,6 +28,7 @@ export interface Attendance {
     date: string;
     status: 'Present' | 'Absent';
     created_at: string;
+    updated_at: string;
 }
 
 /** Payload for marking attendance */
@@ -36,11 +38,31 @@ export interface AttendanceCreate {
     status: 'Present' | 'Absent';
 }
 
+/** Employee with no attendance marked on a given date */
+export interface UnmarkedAttendance {
+    date: string;
+    employee_id: string;
+    full_name: string;
+    department: string;
+}
+
+/** Cursor-paginated page of unmarked attendance */
+export interface UnmarkedAttendanceResponse {
+    success: boolean;
+    data: UnmarkedAttendance[];
+    count: number;
+    next_cursor: string | null;
+}
+
 /** Generic API list response */
 export interface ApiListResponse<T> {
     success: boolean;
     data: T[];
     count: number;
+    /** Delta responses only: ids deleted since `since` */
+    deleted_ids?: number[];
+    /** Pass back as `since` to fetch only later changes */
+    server_time?: string;
 }
 
 /** Generic API single response */